@@ -3,73 +3,182 @@
 检查报告文件是否包含黄金分析
 """
 
+import argparse
+import bisect
+import io
+import mmap
+import re
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 
 
-def check_report_file(filepath):
-    """检查报告文件内容"""
-    print(f"检查文件: {filepath}")
+# 超过该大小的报告使用 mmap 读取，避免整份文件复制到内存
+MMAP_THRESHOLD = 256 * 1024
+
+# 并发检查报告文件的线程数
+MAX_WORKERS = 8
+
+# 报告检查项：(关键字, 描述)
+CHECKS = (
+    ('黄金', "包含'黄金'字样"),
+    ('🥇', "包含黄金emoji"),
+    ('Au9999', "包含Au9999代码"),
+    ('GC=F', "包含GC=F代码"),
+    ('黄金投资分析', "包含黄金章节"),
+)
+
+GOLD_KEYWORDS = tuple(keyword for keyword, _ in CHECKS)
+
+# 所有关键字合并为一个正则，一次扫描即可得到全部命中位置
+# 直接在 UTF-8 字节上匹配，检查阶段无需解码整个文件
+# 长关键字优先，避免 '黄金' 抢先匹配掉 '黄金投资分析'
+_KEYWORD_RE = re.compile(
+    b'|'.join(re.escape(k.encode('utf-8')) for k in sorted(GOLD_KEYWORDS, key=len, reverse=True))
+)
+
+# 每个匹配结果所包含的关键字（如 '黄金投资分析' 同时命中 '黄金'）
+_CONTAINED_KEYWORDS = {
+    k.encode('utf-8'): frozenset(other for other in GOLD_KEYWORDS if other in k)
+    for k in GOLD_KEYWORDS
+}
+
+# 需要展示内容片段的关键字
+SNIPPET_KEYWORDS = ('黄金', '🥇', 'Au9999', 'GC=F')
+
+# 判定报告是否包含黄金分析的关键字
+_GOLD_MARKERS = ('黄金'.encode('utf-8'), '🥇'.encode('utf-8'))
+
+_SNIPPET_RE = re.compile(b'|'.join(re.escape(k.encode('utf-8')) for k in SNIPPET_KEYWORDS))
+_NEWLINE_RE = re.compile(b'\n')
+
+
+@contextmanager
+def _open_report(filepath):
+    """以字节形式打开报告；大文件返回只读 mmap，小文件直接读入"""
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield mm
+        else:
+            yield f.read()
+
+
+def contains_gold(content):
+    """快速判断字节内容是否包含黄金分析，命中第一个关键字即返回"""
+    return any(content.find(marker) != -1 for marker in _GOLD_MARKERS)
+
+
+def _find_keywords(content):
+    """单次扫描字节内容，返回出现过的关键字集合"""
+    found = set()
+    for token in {m.group() for m in _KEYWORD_RE.finditer(content)}:
+        found |= _CONTAINED_KEYWORDS[token]
+    return found
+
+
+def _iter_snippet_lines(content):
+    """逐个产出包含片段关键字的行 (行号, 行字节内容)，每行只产出一次"""
+    line_starts = [0]
+    line_starts.extend(m.end() for m in _NEWLINE_RE.finditer(content))
+    total = len(line_starts)
+    last_line = 0
+    for m in _SNIPPET_RE.finditer(content):
+        line_no = bisect.bisect_right(line_starts, m.start())
+        if line_no == last_line:
+            continue
+        last_line = line_no
+        end = line_starts[line_no] - 1 if line_no < total else len(content)
+        # 与文本模式读取一致，去掉 CRLF 换行残留的 \r
+        yield line_no, content[line_starts[line_no - 1]:end].rstrip(b'\r')
+
+
+def check_report_file(filepath, verbose=True, out=None):
+    """
+    检查报告文件内容
+
+    Args:
+        filepath: 报告文件路径
+        verbose: 是否输出逐项检查结果和内容片段；为 False 时只做快速判断
+        out: 输出流，默认为标准输出
+    """
+    out = out or sys.stdout
+    print(f"检查文件: {filepath}", file=out)
 
     if not os.path.exists(filepath):
-        print(f"  ❌ 文件不存在")
+        print(f"  ❌ 文件不存在", file=out)
         return False
 
-    with open(filepath, 'r', encoding='utf-8') as f:
-        content = f.read()
+    with _open_report(filepath) as content:
+        print(f"  ✅ 文件存在，大小: {len(content)} 字节", file=out)
 
-    print(f"  ✅ 文件存在，大小: {len(content)} 字符")
+        if not verbose:
+            has_gold = contains_gold(content)
+            print(f"  {'✅' if has_gold else '❌'} 包含黄金分析: {has_gold}", file=out)
+            return has_gold
 
-    # 检查关键内容
-    checks = [
-        ('黄金' in content, "包含'黄金'字样"),
-        ('🥇' in content, "包含黄金emoji"),
-        ('Au9999' in content, "包含Au9999代码"),
-        ('GC=F' in content, "包含GC=F代码"),
-        ('黄金投资分析' in content, "包含黄金章节"),
-    ]
+        found = _find_keywords(content)
+
+        # 检查关键内容
+        for keyword, desc in CHECKS:
+            check = keyword in found
+            status = "✅" if check else "❌"
+            print(f"  {status} {desc}: {check}", file=out)
+
+        # 显示黄金相关的内容片段
+        if '黄金' in found:
+            print("\n  黄金相关内容片段:", file=out)
+            for line_no, line in _iter_snippet_lines(content):
+                print(f"    行 {line_no}: {line.decode('utf-8', 'replace')[:100]}", file=out)
 
-    for check, desc in checks:
-        status = "✅" if check else "❌"
-        print(f"  {status} {desc}: {check}")
+    return '黄金' in found or '🥇' in found
 
-    # 显示黄金相关的内容片段
-    if '黄金' in content:
-        print("\n  黄金相关内容片段:")
-        lines = content.split('\n')
-        for i, line in enumerate(lines):
-            if '黄金' in line or '🥇' in line or 'Au9999' in line or 'GC=F' in line:
-                print(f"    行 {i+1}: {line[:100]}")
 
-    return '黄金' in content or '🥇' in content
+def _check_report_buffered(filepath, verbose=True):
+    """检查单个报告文件，输出写入缓冲区，返回 (是否包含黄金分析, 输出文本)"""
+    buf = io.StringIO()
+    found = check_report_file(filepath, verbose=verbose, out=buf)
+    return found, buf.getvalue()
 
 
-def main():
+def main(verbose=True):
     """主函数"""
     print("=" * 60)
     print("检查报告文件中的黄金分析")
     print("=" * 60)
 
+    base_dir = Path(__file__).parent
+    reports_dir = base_dir / 'reports'
+    archive_dir = base_dir / 'Result' / 'analysis-reports-27' / 'reports'
+
     # 检查可能的报告位置
     report_paths = [
-        Path(__file__).parent / 'reports' / 'report_20260211.md',
-        Path(__file__).parent / 'reports' / 'report_20250211.md',
-        Path(__file__).parent / 'Result' / 'analysis-reports-27' / 'reports' / 'report_20260211.md',
-        Path(__file__).parent / 'Result' / 'analysis-reports-27' / 'reports' / 'report_20250211.md',
+        reports_dir / 'report_20260211.md',
+        reports_dir / 'report_20250211.md',
+        archive_dir / 'report_20260211.md',
+        archive_dir / 'report_20250211.md',
     ]
 
-    # 也检查 reports 目录下的所有 md 文件
-    reports_dir = Path(__file__).parent / 'reports'
-    if reports_dir.exists():
-        for md_file in reports_dir.glob('*.md'):
-            if md_file not in report_paths:
-                report_paths.append(md_file)
+    # 也检查 reports 目录下的所有 md 文件（scandir 无需逐个 stat）
+    if reports_dir.is_dir():
+        seen = {str(p) for p in report_paths}
+        with os.scandir(reports_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.md') and entry.path not in seen and entry.is_file(follow_symlinks=False):
+                    seen.add(entry.path)
+                    report_paths.append(entry.path)
+
+    # 并发读取各报告文件，按原顺序输出检查结果，避免输出交错
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(lambda path: _check_report_buffered(path, verbose), report_paths))
 
     found_gold = False
-    for path in report_paths:
+    for found, output in results:
         print(f"\n{'='*60}")
-        if check_report_file(path):
+        print(output, end='')
+        if found:
             found_gold = True
 
     print("\n" + "=" * 60)
@@ -88,4 +197,7 @@ def main():
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    parser = argparse.ArgumentParser(description="检查报告文件是否包含黄金分析")
+    parser.add_argument('-q', '--quiet', action='store_true', help="只判断是否包含黄金分析，不输出逐项检查明细")
+    args = parser.parse_args()
+    sys.exit(main(verbose=not args.quiet))
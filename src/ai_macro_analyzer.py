@@ -18,12 +18,80 @@ AI驱动的黄金宏观分析模块
 
 import logging
 import json
+from itertools import islice
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 
+# === 提示词模板 ===
+
+_SYSTEM_PROMPT = """
+你是一位专业的黄金投资分析师，擅长分析宏观经济因素对黄金价格的影响。
+请基于以下数据，提供专业、客观的黄金投资分析：
+
+"""
+
+_TECHNICAL_TEMPLATE = (
+    "【技术分析数据】\n"
+    "趋势判断: {trend_status}\n"
+    "趋势强度: {trend_strength}/100\n"
+    "均线排列: {ma_alignment}\n"
+    "当前价格: {current_price}\n"
+    "技术评分: {signal_score}/100\n"
+    "操作建议: {buy_signal}\n"
+    "\n"
+)
+
+_MACRO_TEMPLATE = (
+    "【宏观数据】\n"
+    "宏观评分: {total_score}/100\n"
+    "宏观总结: {summary}\n"
+)
+
+_REQUIREMENT_PROMPT = """
+请提供以下分析：
+1. 当前宏观环境对黄金的整体影响（利好/利空/中性）
+2. 关键驱动因素分析（重点分析对黄金价格影响最大的2-3个因素）
+3. 短期（1-2周）价格走势预判
+4. 投资建议（仓位、入场时机、止损策略等）
+5. 风险提示
+
+要求：
+- 使用中文回答
+- 保持专业、客观的分析风格
+- 基于提供的数据进行分析，不要编造信息
+- 分析要具体，有数据支持
+- 建议要实用，可操作性强
+- 回答简洁明了，不要冗长
+"""
+
+
+# google.generativeai 模块句柄，首次使用时导入
+_genai = None
+
+
+def _get_genai():
+    """获取 google.generativeai 模块（延迟导入，只导入一次）"""
+    global _genai
+    
+    if _genai is None:
+        import google.generativeai as genai
+        _genai = genai
+    
+    return _genai
+
+
+class _PromptFields(dict):
+    """
+    提示词模板字段，缺失的键填充为 'N/A'
+    """
+    
+    def __missing__(self, key: str) -> str:
+        return 'N/A'
+
+
 class BaseAIAnalyzer:
     """
     AI分析器基类
@@ -53,6 +121,11 @@ class GeminiAnalyzer(BaseAIAnalyzer):
     Gemini AI分析器
     """
     
+    MODEL_NAME = 'gemini-1.5-flash'
+    
+    # 按 API Key 缓存的模型实例，供同一进程内的多个分析器共享
+    _model_cache: Dict[str, Any] = {}
+    
     def __init__(self, api_key: Optional[str] = None):
         """
         初始化Gemini分析器
@@ -72,9 +145,17 @@ class GeminiAnalyzer(BaseAIAnalyzer):
         初始化Gemini客户端
         """
         try:
-            import google.generativeai as genai
+            genai = _get_genai()
             genai.configure(api_key=self.api_key)
-            self.client = genai.GenerativeModel('gemini-1.5-flash')
+            
+            cached = self._model_cache.get(self.api_key)
+            if cached is not None:
+                self.client = cached
+                logger.info("复用已初始化的Gemini客户端")
+                return
+            
+            self.client = genai.GenerativeModel(self.MODEL_NAME)
+            self._model_cache[self.api_key] = self.client
             logger.info("Gemini客户端初始化成功")
         except ImportError:
             logger.error("google-generativeai 未安装，请运行: pip install google-generativeai")
@@ -214,76 +295,39 @@ class AIGoldMacroAnalyzer:
         Returns:
             构建好的提示词
         """
-        prompt_parts = []
-        
-        # 系统提示
-        prompt_parts.append("""
-你是一位专业的黄金投资分析师，擅长分析宏观经济因素对黄金价格的影响。
-请基于以下数据，提供专业、客观的黄金投资分析：
-
-""")
-        
         # 技术分析数据
+        technical_section = ""
         if technical_analysis:
-            prompt_parts.append("【技术分析数据】\n")
-            prompt_parts.append(f"趋势判断: {technical_analysis.get('trend_status', 'N/A')}\n")
-            prompt_parts.append(f"趋势强度: {technical_analysis.get('trend_strength', 'N/A')}/100\n")
-            prompt_parts.append(f"均线排列: {technical_analysis.get('ma_alignment', 'N/A')}\n")
-            prompt_parts.append(f"当前价格: {technical_analysis.get('current_price', 'N/A')}\n")
-            prompt_parts.append(f"技术评分: {technical_analysis.get('signal_score', 'N/A')}/100\n")
-            prompt_parts.append(f"操作建议: {technical_analysis.get('buy_signal', 'N/A')}\n")
-            prompt_parts.append("\n")
+            technical_section = _TECHNICAL_TEMPLATE.format_map(_PromptFields(technical_analysis))
         
         # 宏观数据
+        macro_section = ""
         if macro_data:
-            prompt_parts.append("【宏观数据】\n")
-            prompt_parts.append(f"宏观评分: {macro_data.get('total_score', 'N/A')}/100\n")
-            prompt_parts.append(f"宏观总结: {macro_data.get('summary', 'N/A')}\n")
-            
+            macro_section = _MACRO_TEMPLATE.format_map(_PromptFields(macro_data))
             factors = macro_data.get('factors', {})
             if factors:
-                prompt_parts.append("关键宏观因素:\n")
-                for factor_name, factor_data in factors.items():
-                    value = factor_data.get('value', 'N/A')
-                    impact = factor_data.get('impact', 'N/A')
-                    score = factor_data.get('score', 'N/A')
-                    prompt_parts.append(f"- {factor_name}: {value} ({impact}) - {score}/100\n")
-            prompt_parts.append("\n")
+                get = dict.get
+                macro_section += "关键宏观因素:\n" + "".join(
+                    f"- {name}: {get(data, 'value', 'N/A')} ({get(data, 'impact', 'N/A')}) "
+                    f"- {get(data, 'score', 'N/A')}/100\n"
+                    for name, data in factors.items()
+                )
+            macro_section += "\n"
         
         # 宏观新闻
+        news_section = ""
         if macro_news:
-            prompt_parts.append("【宏观新闻摘要】\n")
-            news_count = 0
-            for category, response in macro_news.items():
-                if hasattr(response, 'results') and response.results:
-                    for news in response.results[:1]:
-                        if news_count >= 5:
-                            break
-                        prompt_parts.append(f"- {news.title}: {news.snippet[:100]}...\n")
-                        news_count += 1
-                    if news_count >= 5:
-                        break
-            prompt_parts.append("\n")
-        
-        # 分析要求
-        prompt_parts.append("""
-请提供以下分析：
-1. 当前宏观环境对黄金的整体影响（利好/利空/中性）
-2. 关键驱动因素分析（重点分析对黄金价格影响最大的2-3个因素）
-3. 短期（1-2周）价格走势预判
-4. 投资建议（仓位、入场时机、止损策略等）
-5. 风险提示
-
-要求：
-- 使用中文回答
-- 保持专业、客观的分析风格
-- 基于提供的数据进行分析，不要编造信息
-- 分析要具体，有数据支持
-- 建议要实用，可操作性强
-- 回答简洁明了，不要冗长
-""")
+            # 每个类别取第一条新闻，最多 5 条
+            first_news = (
+                response.results[0]
+                for response in macro_news.values()
+                if getattr(response, 'results', None)
+            )
+            news_section = "【宏观新闻摘要】\n" + "".join(
+                f"- {news.title}: {news.snippet[:100]}...\n" for news in islice(first_news, 5)
+            ) + "\n"
         
-        return "".join(prompt_parts)
+        return _SYSTEM_PROMPT + technical_section + macro_section + news_section + _REQUIREMENT_PROMPT
     
     def generate_investment_report(
         self,
@@ -213,11 +213,11 @@ class StockAnalysisPipeline:
             # Step 3: 获取宏观数据
             logger.info(f"[{code}] 步骤3: 开始宏观数据分析...")
             macro_data = {}
-            if hasattr(technical_result, 'macro_score') and technical_result.macro_score:
+            if technical_result.macro_score:
                 macro_data = {
                     "total_score": technical_result.macro_score,
-                    "summary": getattr(technical_result, 'macro_summary', ''),
-                    "factors": getattr(technical_result, 'macro_factors', {})
+                    "summary": technical_result.macro_summary or '',
+                    "factors": technical_result.macro_factors or {}
                 }
                 logger.info(f"[{code}] 宏观数据获取完成: score={technical_result.macro_score}")
             else:
@@ -16,9 +16,14 @@
 - 量能形态：缩量回调优先，黄金交易量特性不同
 """
 
+import io
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List, Tuple
+from datetime import datetime
+from itertools import islice
+from typing import Optional, Dict, Any, List, Tuple, Callable
 from enum import Enum
 
 import pandas as pd
@@ -31,6 +36,37 @@ from .macro_data_provider import GoldMacroAnalyzer
 logger = logging.getLogger(__name__)
 
 
+# 宏观新闻关键词
+_BULLISH_KEYWORDS = ('加息', '通胀', '地缘政治', '避险', '央行购金', '不确定性')  # 利好
+_BEARISH_KEYWORDS = ('降息', '经济强劲', '美元走强', '通胀缓解')  # 利空
+
+
+def _compile_keywords(keywords: Tuple[str, ...]) -> re.Pattern:
+    """
+    将一组关键词编译为单个正则，一次扫描即可找出全部命中
+    
+    使用零宽前瞻匹配，相邻或重叠出现的关键词也都能找到。
+    """
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile('(?=(' + '|'.join(re.escape(kw) for kw in ordered) + '))')
+
+
+# 能包含关键词的最短新闻文本长度
+_MIN_KEYWORD_LEN = min(len(kw) for kw in _BULLISH_KEYWORDS + _BEARISH_KEYWORDS)
+
+# 利好、利空分别编译，'通胀' 与 '通胀缓解' 这类跨组重叠的关键词互不影响
+_BULLISH_RE = _compile_keywords(_BULLISH_KEYWORDS)
+_BEARISH_RE = _compile_keywords(_BEARISH_KEYWORDS)
+
+# 黄金市场通用提示（报告固定段落）
+_GOLD_MARKET_TIPS = (
+    "\n\n💡 黄金市场提示:\n"
+    "   - 黄金作为避险资产，在市场不确定性增加时往往表现强势\n"
+    "   - 黄金价格受全球宏观经济、地缘政治等因素影响较大\n"
+    "   - 黄金趋势一旦形成，往往持续时间较长"
+)
+
+
 class GoldTrendAnalyzer(StockTrendAnalyzer):
     """
     黄金趋势分析器
@@ -49,6 +85,7 @@ class GoldTrendAnalyzer(StockTrendAnalyzer):
     VOLUME_SHRINK_RATIO = 0.7   # 缩量判断阈值（当日量/5日均量）
     VOLUME_HEAVY_RATIO = 1.8    # 放量判断阈值，黄金交易量特性不同，设为1.8
     MA_SUPPORT_TOLERANCE = 0.02  # MA 支撑判断容忍度（2%）
+    MACRO_NEWS_SCAN_LIMIT = 10   # 每个宏观新闻类别最多统计的新闻条数
 
     def __init__(self):
         """初始化黄金分析器"""
@@ -57,6 +94,12 @@ class GoldTrendAnalyzer(StockTrendAnalyzer):
         self.macro_analyzer = GoldMacroAnalyzer()
         logger.info("初始化黄金趋势分析器")
     
+    def _calculate_mas(self, df: pd.DataFrame) -> pd.DataFrame:
+        """计算均线，并附加前5日均量（不含当日）供量能分析使用"""
+        df = super()._calculate_mas(df)
+        df['VOL_MA5'] = df['volume'].rolling(window=5, min_periods=1).mean().shift(1)
+        return df
+    
     def _analyze_volume(self, df: pd.DataFrame, result: TrendAnalysisResult) -> None:
         """
         针对黄金期货优化的量能分析
@@ -69,25 +112,36 @@ class GoldTrendAnalyzer(StockTrendAnalyzer):
         if len(df) < 5:
             return
         
-        latest = df.iloc[-1]
-        vol_5d_avg = df['volume'].iloc[-6:-1].mean()
+        # 直接使用底层 ndarray 视图，避免 iloc 逐行构造 Series 的开销
+        close = df['close'].to_numpy()
+        
+        latest_vol = float(df['volume'].iat[-1])
+        # 优先使用 _calculate_mas 预先算好的前5日均量，未经其处理的数据则现算
+        if 'VOL_MA5' in df.columns:
+            vol_5d_avg = df['VOL_MA5'].iat[-1]
+        else:
+            vol_5d_avg = df['volume'].iloc[-6:-1].mean()
         
         if vol_5d_avg > 0:
-            result.volume_ratio_5d = float(latest['volume']) / vol_5d_avg
+            result.volume_ratio_5d = latest_vol / vol_5d_avg
         
         # 判断价格变化
-        prev_close = df.iloc[-2]['close']
-        price_change = (latest['close'] - prev_close) / prev_close * 100
+        latest_close = float(close[-1])
+        prev_close = float(close[-2])
+        price_change = (latest_close - prev_close) / prev_close * 100
         
         # 黄金特有的量能判断逻辑
-        if result.volume_ratio_5d >= self.VOLUME_HEAVY_RATIO:
+        volume_ratio = result.volume_ratio_5d
+        heavy_ratio = self.VOLUME_HEAVY_RATIO
+        shrink_ratio = self.VOLUME_SHRINK_RATIO
+        if volume_ratio >= heavy_ratio:
             if price_change > 0:
                 result.volume_status = VolumeStatus.HEAVY_VOLUME_UP
                 result.volume_trend = "放量上涨，多头力量强劲（黄金）"
             else:
                 result.volume_status = VolumeStatus.HEAVY_VOLUME_DOWN
                 result.volume_trend = "放量下跌，注意风险（黄金）"
-        elif result.volume_ratio_5d <= self.VOLUME_SHRINK_RATIO:
+        elif volume_ratio <= shrink_ratio:
             if price_change > 0:
                 result.volume_status = VolumeStatus.SHRINK_VOLUME_UP
                 result.volume_trend = "缩量上涨，上攻动能不足（黄金）"
@@ -147,11 +201,6 @@ class GoldTrendAnalyzer(StockTrendAnalyzer):
         factors = {}
         total_score = 50
         
-        # 利好关键词
-        bullish_keywords = ['加息', '通胀', '地缘政治', '避险', '央行购金', '不确定性']
-        # 利空关键词
-        bearish_keywords = ['降息', '经济强劲', '美元走强', '通胀缓解']
-        
         for category, response in macro_news.items():
             if not response.success or not response.results:
                 continue
@@ -160,15 +209,13 @@ class GoldTrendAnalyzer(StockTrendAnalyzer):
             bullish_count = 0
             bearish_count = 0
             
-            for result in response.results:
-                content = f"{result.title} {result.snippet}"
-                # 统计关键词
-                for kw in bullish_keywords:
-                    if kw in content:
-                        bullish_count += 1
-                for kw in bearish_keywords:
-                    if kw in content:
-                        bearish_count += 1
+            for result in response.results[:self.MACRO_NEWS_SCAN_LIMIT]:
+                if len(result.title) < _MIN_KEYWORD_LEN and len(result.snippet) < _MIN_KEYWORD_LEN:
+                    continue
+                content = result.title + " " + result.snippet
+                # 统计关键词（每个关键词在一条新闻中只计一次）
+                bullish_count += len(set(_BULLISH_RE.findall(content)))
+                bearish_count += len(set(_BEARISH_RE.findall(content)))
             
             # 计算得分
             if bullish_count > bearish_count:
@@ -188,7 +235,7 @@ class GoldTrendAnalyzer(StockTrendAnalyzer):
         return {
             'total_score': round(total_score),
             'factors': factors,
-            'timestamp': pd.Timestamp.now().isoformat()
+            'timestamp': datetime.now().isoformat(timespec='seconds')
         }
     
     def analyze_with_macro(self, df: pd.DataFrame, code: str) -> TrendAnalysisResult:
@@ -202,46 +249,55 @@ class GoldTrendAnalyzer(StockTrendAnalyzer):
         Returns:
             TrendAnalysisResult 分析结果
         """
-        # 1. 执行基础技术分析
-        result = self.analyze(df, code)
-        
-        # 2. 获取宏观新闻
-        macro_news_score = 50
-        try:
+        # 宏观新闻和结构化宏观数据都来自网络请求，提交到线程池并发获取，
+        # 与技术分析重叠执行，总耗时取决于最慢的一项
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            news_future = None
             if self.search_service and self.search_service.is_available:
-                logger.info(f"搜索黄金宏观因素新闻")
-                macro_news = self.search_service.search_gold_macro_news(max_results=3)
-                
-                if macro_news:
-                    # 分析新闻宏观因素
-                    news_analysis = self._analyze_macro_factors(macro_news)
-                    macro_news_score = news_analysis['total_score']
-                    result.macro_news = macro_news
-                    logger.info(f"新闻宏观因素分析完成，总评分: {macro_news_score}")
+                logger.info("搜索黄金宏观因素新闻")
+                news_future = executor.submit(self.search_service.search_gold_macro_news, max_results=3)
+            
+            logger.info("获取黄金宏观数据")
+            data_future = executor.submit(self.macro_analyzer.get_macro_score)
+            
+            # 1. 执行基础技术分析
+            result = self.analyze(df, code)
+            
+            # 2. 获取宏观新闻
+            macro_news_score = 50
+            try:
+                if news_future is not None:
+                    macro_news = news_future.result()
+                    
+                    if macro_news:
+                        # 分析新闻宏观因素
+                        news_analysis = self._analyze_macro_factors(macro_news)
+                        macro_news_score = news_analysis['total_score']
+                        result.macro_news = macro_news
+                        logger.info("新闻宏观因素分析完成，总评分: %s", macro_news_score)
+                    else:
+                        logger.info("未获取到宏观新闻数据")
                 else:
-                    logger.info("未获取到宏观新闻数据")
-            else:
-                logger.info("搜索服务不可用，跳过新闻宏观因素分析")
-        except Exception as e:
-            logger.warning(f"获取宏观新闻失败: {e}")
-        
-        # 3. 获取结构化宏观数据
-        macro_data_score = 50
-        try:
-            logger.info(f"获取黄金宏观数据")
-            macro_data = self.macro_analyzer.get_macro_score()
+                    logger.info("搜索服务不可用，跳过新闻宏观因素分析")
+            except Exception as e:
+                logger.warning(f"获取宏观新闻失败: {e}")
             
-            if macro_data:
-                macro_data_score = macro_data['total_score']
-                result.macro_score = macro_data_score
-                result.macro_factors = macro_data['factors']
-                result.macro_summary = macro_data['summary']
-                result.macro_timestamp = macro_data['timestamp']
-                logger.info(f"结构化宏观数据分析完成，总评分: {macro_data_score}")
-            else:
-                logger.info("未获取到结构化宏观数据")
-        except Exception as e:
-            logger.warning(f"获取结构化宏观数据失败: {e}")
+            # 3. 获取结构化宏观数据
+            macro_data_score = 50
+            try:
+                macro_data = data_future.result()
+                
+                if macro_data:
+                    macro_data_score = macro_data['total_score']
+                    result.macro_score = macro_data_score
+                    result.macro_factors = macro_data['factors']
+                    result.macro_summary = macro_data['summary']
+                    result.macro_timestamp = macro_data['timestamp']
+                    logger.info("结构化宏观数据分析完成，总评分: %s", macro_data_score)
+                else:
+                    logger.info("未获取到结构化宏观数据")
+            except Exception as e:
+                logger.warning(f"获取结构化宏观数据失败: {e}")
         
         # 4. 计算综合宏观评分
         # 新闻评分权重 30%，结构化数据评分权重 70%
@@ -260,9 +316,9 @@ class GoldTrendAnalyzer(StockTrendAnalyzer):
         result.signal_score = int(original_technical_score * 0.6 + total_macro_score * 0.4)
         result.signal_score = max(0, min(100, result.signal_score))
         
-        logger.info(f"技术评分: {original_technical_score}, 新闻评分: {macro_news_score}, "
-                   f"数据评分: {macro_data_score}, 综合宏观评分: {total_macro_score}, "
-                   f"最终信号评分: {result.signal_score}")
+        logger.info("技术评分: %s, 新闻评分: %s, 数据评分: %s, 综合宏观评分: %s, 最终信号评分: %s",
+                    original_technical_score, macro_news_score, macro_data_score,
+                    total_macro_score, result.signal_score)
         
         return result
     
@@ -276,108 +332,141 @@ class GoldTrendAnalyzer(StockTrendAnalyzer):
         Returns:
             格式化的分析文本
         """
-        lines = [
-            f"=== {result.code} 黄金趋势分析 ===",
-            f"",
-            f"📊 趋势判断: {result.trend_status.value}",
-            f"   均线排列: {result.ma_alignment}",
-            f"   趋势强度: {result.trend_strength}/100",
-            f"",
-            f"📈 均线数据:",
-            f"   现价: {result.current_price:.2f}",
-            f"   MA5:  {result.ma5:.2f} (乖离 {result.bias_ma5:+.2f}%)",
-            f"   MA10: {result.ma10:.2f} (乖离 {result.bias_ma10:+.2f}%)",
-            f"   MA20: {result.ma20:.2f} (乖离 {result.bias_ma20:+.2f}%)",
-            f"",
-            f"📊 量能分析: {result.volume_status.value}",
-            f"   量比(vs5日): {result.volume_ratio_5d:.2f}",
-            f"   量能趋势: {result.volume_trend}",
-            f"",
-            f"📈 MACD指标: {result.macd_status.value}",
-            f"   DIF: {result.macd_dif:.4f}",
-            f"   DEA: {result.macd_dea:.4f}",
-            f"   MACD: {result.macd_bar:.4f}",
-            f"   信号: {result.macd_signal}",
-            f"",
-            f"📊 RSI指标: {result.rsi_status.value}",
-            f"   RSI(6): {result.rsi_6:.1f}",
-            f"   RSI(12): {result.rsi_12:.1f}",
-            f"   RSI(24): {result.rsi_24:.1f}",
-            f"   信号: {result.rsi_signal}",
-            f"",
-            f"🎯 操作建议: {result.buy_signal.value}",
-            f"   综合评分: {result.signal_score}/100",
-        ]
-
-        if result.signal_reasons:
-            lines.append(f"")
-            lines.append(f"✅ 买入理由:")
-            for reason in result.signal_reasons:
-                lines.append(f"   {reason}")
-
-        if result.risk_factors:
-            lines.append(f"")
-            lines.append(f"⚠️ 风险因素:")
-            for risk in result.risk_factors:
-                lines.append(f"   {risk}")
+        signal_reasons = result.signal_reasons
+        risk_factors = result.risk_factors
+
+        header = (
+            f"=== {result.code} 黄金趋势分析 ===\n"
+            f"\n"
+            f"📊 趋势判断: {result.trend_status.value}\n"
+            f"   均线排列: {result.ma_alignment}\n"
+            f"   趋势强度: {result.trend_strength}/100\n"
+            f"\n"
+            f"📈 均线数据:\n"
+            f"   现价: {result.current_price:.2f}\n"
+            f"   MA5:  {result.ma5:.2f} (乖离 {result.bias_ma5:+.2f}%)\n"
+            f"   MA10: {result.ma10:.2f} (乖离 {result.bias_ma10:+.2f}%)\n"
+            f"   MA20: {result.ma20:.2f} (乖离 {result.bias_ma20:+.2f}%)\n"
+            f"\n"
+            f"📊 量能分析: {result.volume_status.value}\n"
+            f"   量比(vs5日): {result.volume_ratio_5d:.2f}\n"
+            f"   量能趋势: {result.volume_trend}\n"
+            f"\n"
+            f"📈 MACD指标: {result.macd_status.value}\n"
+            f"   DIF: {result.macd_dif:.4f}\n"
+            f"   DEA: {result.macd_dea:.4f}\n"
+            f"   MACD: {result.macd_bar:.4f}\n"
+            f"   信号: {result.macd_signal}\n"
+            f"\n"
+            f"📊 RSI指标: {result.rsi_status.value}\n"
+            f"   RSI(6): {result.rsi_6:.1f}\n"
+            f"   RSI(12): {result.rsi_12:.1f}\n"
+            f"   RSI(24): {result.rsi_24:.1f}\n"
+            f"   信号: {result.rsi_signal}\n"
+            f"\n"
+            f"🎯 操作建议: {result.buy_signal.value}\n"
+            f"   综合评分: {result.signal_score}/100"
+        )
+        buf = io.StringIO()
+        write = buf.write
+        write(header)
+
+        if signal_reasons:
+            write("\n\n✅ 买入理由:")
+            for reason in signal_reasons:
+                write(f"\n   {reason}")
+
+        if risk_factors:
+            write("\n\n⚠️ 风险因素:")
+            for risk in risk_factors:
+                write(f"\n   {risk}")
 
         # 添加黄金特有的分析提示
-        lines.append(f"")
-        lines.append(f"💡 黄金市场提示:")
-        lines.append(f"   - 黄金作为避险资产，在市场不确定性增加时往往表现强势")
-        lines.append(f"   - 黄金价格受全球宏观经济、地缘政治等因素影响较大")
-        lines.append(f"   - 黄金趋势一旦形成，往往持续时间较长")
+        write(_GOLD_MARKET_TIPS)
 
         # 添加宏观因素分析
-        if hasattr(result, 'macro_score') and result.macro_score is not None:
-            lines.append(f"")
-            lines.append(f"🌍 宏观因素分析:")
-            
-            # 显示评分详情（如果有）
-            if hasattr(result, 'technical_score'):
-                lines.append(f"   评分详情:")
-                lines.append(f"   - 技术评分: {result.technical_score}/100 (权重60%)")
-                lines.append(f"   - 宏观评分: {result.total_macro_score}/100 (权重40%)")
-                if hasattr(result, 'macro_news_score'):
-                    lines.append(f"     - 新闻评分: {result.macro_news_score}/100 (权重30%)")
-                if hasattr(result, 'macro_data_score'):
-                    lines.append(f"     - 数据评分: {result.macro_data_score}/100 (权重70%)")
-                lines.append(f"")
-            
-            lines.append(f"   综合评分: {result.macro_score}/100")
-            
-            if hasattr(result, 'macro_summary') and result.macro_summary:
-                lines.append(f"   分析总结: {result.macro_summary}")
-            
-            if hasattr(result, 'macro_factors') and result.macro_factors:
-                lines.append(f"   关键因素:")
-                for factor_name, factor_data in result.macro_factors.items():
-                    score = factor_data['score']
-                    value = factor_data.get('value', 'N/A')
-                    change = factor_data.get('change', '')
-                    change_str = f" (变化{change}%)" if change else ""
-                    emoji = "📈" if score > 60 else "📉" if score < 40 else "➡️"
-                    lines.append(f"   {emoji} {factor_name}: {value}{change_str} ({score}/100)")
-            
-            if hasattr(result, 'macro_news') and result.macro_news:
-                lines.append(f"")
-                lines.append(f"📰 宏观新闻摘要:")
-                news_count = 0
-                for category, response in result.macro_news.items():
-                    if response.success and response.results:
-                        for i, news in enumerate(response.results[:1]):  # 每个类别只显示1条新闻
-                            if news_count >= 3:
-                                break
-                            lines.append(f"   • {news.title[:80]}")
-                            news_count += 1
-                        if news_count >= 3:
-                            break
-            
-            if hasattr(result, 'macro_timestamp'):
-                lines.append(f"")
-                lines.append(f"   🕒 数据时间: {result.macro_timestamp[:19]}")
+        if result.macro_score is not None:
+            self._write_macro_section(result, write)
+
+        return buf.getvalue()
+
+    def _write_macro_section(self, result: TrendAnalysisResult, write: Callable[[str], Any]) -> None:
+        """
+        写入宏观因素分析部分（每行以换行符开头）
+        
+        Args:
+            result: 分析结果
+            write: 输出缓冲区的 write 方法
+        """
+        technical_score = result.technical_score
+        macro_news_score = result.macro_news_score
+        macro_data_score = result.macro_data_score
+        macro_summary = result.macro_summary
+        macro_factors = result.macro_factors
+        macro_news = result.macro_news
+        macro_timestamp = result.macro_timestamp
+
+        write("\n\n🌍 宏观因素分析:")
 
-        return "\n".join(lines)
+        # 显示评分详情（如果有）
+        if technical_score is not None:
+            write("\n   评分详情:")
+            write(f"\n   - 技术评分: {technical_score}/100 (权重60%)")
+            write(f"\n   - 宏观评分: {result.total_macro_score}/100 (权重40%)")
+            if macro_news_score is not None:
+                write(f"\n     - 新闻评分: {macro_news_score}/100 (权重30%)")
+            if macro_data_score is not None:
+                write(f"\n     - 数据评分: {macro_data_score}/100 (权重70%)")
+            write("\n")
+
+        write(f"\n   综合评分: {result.macro_score}/100")
+
+        if macro_summary:
+            write(f"\n   分析总结: {macro_summary}")
+
+        if macro_factors:
+            write("\n   关键因素:")
+            for factor_name, factor_data in macro_factors.items():
+                score = factor_data['score']
+                value = factor_data.get('value', 'N/A')
+                change = factor_data.get('change', '')
+                change_str = f" (变化{change}%)" if change else ""
+                emoji = "📈" if score > 60 else "📉" if score < 40 else "➡️"
+                write(f"\n   {emoji} {factor_name}: {value}{change_str} ({score}/100)")
+
+        if macro_news:
+            write("\n\n📰 宏观新闻摘要:")
+            # 每个类别只显示1条新闻，最多3条
+            first_news = (
+                response.results[0]
+                for response in macro_news.values()
+                if response.success and response.results
+            )
+            for news in islice(first_news, 3):
+                write(f"\n   • {news.title[:80]}")
+
+        if macro_timestamp is not None:
+            write(f"\n\n   🕒 数据时间: {macro_timestamp[:19]}")
+
+
+# === 便捷函数 ===
+_gold_analyzer: Optional[GoldTrendAnalyzer] = None
+
+
+def get_gold_analyzer() -> GoldTrendAnalyzer:
+    """获取黄金趋势分析器单例"""
+    global _gold_analyzer
+    
+    if _gold_analyzer is None:
+        _gold_analyzer = GoldTrendAnalyzer()
+    
+    return _gold_analyzer
+
+
+def reset_gold_analyzer() -> None:
+    """重置黄金趋势分析器（用于测试）"""
+    global _gold_analyzer
+    _gold_analyzer = None
 
 
 def analyze_gold(df: pd.DataFrame, code: str, include_macro: bool = True) -> TrendAnalysisResult:
@@ -392,7 +481,7 @@ def analyze_gold(df: pd.DataFrame, code: str, include_macro: bool = True) -> Tre
     Returns:
         TrendAnalysisResult 分析结果
     """
-    analyzer = GoldTrendAnalyzer()
+    analyzer = get_gold_analyzer()
     if include_macro:
         return analyzer.analyze_with_macro(df, code)
     else:
@@ -411,18 +500,17 @@ if __name__ == "__main__":
     
     # 模拟黄金价格数据（波动相对较小）
     base_price = 2000.0
-    prices = [base_price]
-    for i in range(59):
-        change = np.random.randn() * 0.01 + 0.002  # 黄金波动相对较小
-        prices.append(prices[-1] * (1 + change))
+    changes = np.random.randn(59) * 0.01 + 0.002  # 黄金波动相对较小
+    prices = np.cumprod(np.concatenate(([base_price], 1 + changes)))
     
+    n = len(prices)
     df = pd.DataFrame({
         'date': dates,
         'open': prices,
-        'high': [p * (1 + np.random.uniform(0, 0.01)) for p in prices],
-        'low': [p * (1 - np.random.uniform(0, 0.01)) for p in prices],
+        'high': prices * (1 + np.random.uniform(0, 0.01, n)),
+        'low': prices * (1 - np.random.uniform(0, 0.01, n)),
         'close': prices,
-        'volume': [np.random.randint(100000, 500000) for _ in prices],  # 黄金交易量特性
+        'volume': np.random.randint(100000, 500000, n),  # 黄金交易量特性
     })
     
     analyzer = GoldTrendAnalyzer()
@@ -17,14 +17,271 @@
 - World Gold Council - 央行购金数据
 """
 
+import functools
 import logging
+import os
+import threading
+import time
 import requests
+import numpy as np
 import pandas as pd
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Callable, List, Protocol, Tuple
+from datetime import datetime
+
+try:
+    import orjson
+    orjson_available = True
+except ImportError:
+    orjson_available = False
 
 logger = logging.getLogger(__name__)
 
+# FRED 观测值接口及国债期限对应的序列
+FRED_API_URL = "https://api.stlouisfed.org/fred/series/observations"
+_FRED_TREASURY_SERIES = {
+    "2Y": "DGS2",
+    "5Y": "DGS5",
+    "10Y": "DGS10",
+    "30Y": "DGS30",
+}
+
+# Yahoo Finance 图表接口（不带浏览器 User-Agent 时容易被限流）
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+_YAHOO_HEADERS = {"User-Agent": "Mozilla/5.0"}
+_YAHOO_CHART_TIMEOUT = 2.0  # 秒
+
+# 磁盘缓存目录
+DISK_CACHE_DIR = os.path.expanduser("~/.cache/macro")
+
+# 利好/利空影响标签
+_BULLISH_IMPACTS = frozenset({"bullish", "strongly_bullish", "slightly_bullish"})
+_BEARISH_IMPACTS = frozenset({"bearish", "strongly_bearish"})
+
+
+@dataclass(frozen=True, slots=True)
+class FactorRule:
+    """
+    宏观因素评分规则
+    
+    reader 从数据提供者读取 (分档依据, 输出字段)，数据缺失时返回 None；
+    thresholds 升序排列，数值严格大于某阈值才进入更高一档。
+    """
+    name: str
+    reader: Callable[["MacroDataProvider"], Optional[Tuple[float, Dict[str, Any]]]]
+    thresholds: Tuple[float, ...]
+    scores: Tuple[int, ...]
+    labels: Tuple[str, ...]
+    
+    def apply(self, measure: float, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        按分档表计算得分与影响
+        
+        side='left' 使恰好等于阈值的数值落在较低一档，与 value > threshold 的判断一致。
+        """
+        i = int(np.searchsorted(self.thresholds, measure, side='left'))
+        return {**fields, "impact": self.labels[i], "score": self.scores[i]}
+
+
+def _read_value(value: Optional[float]) -> Optional[Tuple[float, Dict[str, Any]]]:
+    """以数值本身作为分档依据"""
+    if value is None:
+        return None
+    return value, {"value": value}
+
+
+def _read_dxy(provider: "MacroDataProvider") -> Optional[Tuple[float, Dict[str, Any]]]:
+    """美元指数以涨跌幅分档"""
+    data = provider.get_dxy_last_change()
+    if data is None:
+        return None
+    current, change = data
+    return change, {"value": round(current, 2), "change": round(change, 2)}
+
+
+def _read_central_bank(provider: "MacroDataProvider") -> Optional[Tuple[float, Dict[str, Any]]]:
+    """央行购金以季度购金总量分档"""
+    data = provider.get_central_bank_gold_purchases()
+    if not data:
+        return None
+    return _read_value(data.get("total_purchases", 0))
+
+
+# 宏观因素评分规则表（顺序即输出顺序）
+_RULES = (
+    # 美元上涨 → 利空黄金；跌幅严格小于 -0.5% 才视为利好，因此下界取 -0.5 左侧相邻的浮点数
+    FactorRule(
+        "dxy", _read_dxy,
+        (float(np.nextafter(-0.5, -np.inf)), 0.5),
+        (70, 50, 30),
+        ("bullish", "neutral", "bearish"),
+    ),
+    # 实际利率上升 → 利空黄金
+    FactorRule(
+        "real_rate", lambda p: _read_value(p.get_real_interest_rate()),
+        (0.0, 1.0, 2.0),
+        (75, 50, 35, 20),
+        ("bullish", "neutral", "bearish", "strongly_bearish"),
+    ),
+    # 通胀上升 → 利好黄金
+    FactorRule(
+        "inflation", lambda p: _read_value(p.get_us_inflation_rate()),
+        (2.0, 3.0, 4.0),
+        (30, 50, 70, 80),
+        ("bearish", "neutral", "bullish", "strongly_bullish"),
+    ),
+    # 央行购金增加 → 利好黄金
+    FactorRule(
+        "central_bank", _read_central_bank,
+        (50, 150, 300),
+        (50, 60, 75, 85),
+        ("neutral", "slightly_bullish", "bullish", "strongly_bullish"),
+    ),
+    # 地缘政治风险上升 → 利好黄金
+    FactorRule(
+        "geopolitical", lambda p: _read_value(p.get_geopolitical_risk_index()),
+        (30, 50, 70),
+        (30, 50, 65, 80),
+        ("bearish", "neutral", "bullish", "strongly_bullish"),
+    ),
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _summary_for(bullish_count: int, bearish_count: int) -> str:
+    """根据利好/利空因素数量生成宏观总结（结果只取决于两个计数，可缓存）"""
+    if bullish_count and not bearish_count:
+        return f"宏观环境整体利好黄金（{bullish_count}项利好因素）"
+    elif bearish_count and not bullish_count:
+        return f"宏观环境整体利空黄金（{bearish_count}项利空因素）"
+    elif bullish_count > bearish_count:
+        return f"宏观环境偏利好黄金（{bullish_count}项利好 vs {bearish_count}项利空）"
+    elif bearish_count > bullish_count:
+        return f"宏观环境偏利空黄金（{bullish_count}项利好 vs {bearish_count}项利空）"
+    else:
+        return "宏观环境中性，关注技术面信号"
+
+
+class CacheBackend(Protocol):
+    """缓存后端接口"""
+    
+    def get(self, key: str) -> Optional[Any]:
+        """获取缓存数据，不存在或已过期时返回 None"""
+        ...
+    
+    def set(self, key: str, data: Any, ttl: int) -> None:
+        """写入缓存数据，ttl 秒后过期"""
+        ...
+
+
+class MemoryCacheBackend:
+    """
+    进程内缓存后端
+    
+    数据随进程结束而失效，diskcache 未安装时使用。
+    条目以 (数据, 过期时刻) 存储，过期时刻基于 time.monotonic()，不受系统时钟调整影响；
+    条目数超过 maxsize 时淘汰最久未使用的条目。
+    """
+    
+    def __init__(self, maxsize: int = 128):
+        """
+        Args:
+            maxsize: 最大缓存条目数
+        """
+        self.maxsize = maxsize
+        self.cache: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry is None:
+                return None
+            
+            data, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self.cache[key]
+                return None
+            
+            self.cache.move_to_end(key)
+            return data
+    
+    def set(self, key: str, data: Any, ttl: int) -> None:
+        with self._lock:
+            self.cache[key] = (data, time.monotonic() + ttl)
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.maxsize:
+                self.cache.popitem(last=False)
+
+
+class DiskCacheBackend:
+    """
+    基于 diskcache 的磁盘缓存后端
+    
+    多个进程/多次运行共享同一份缓存，无需额外服务
+    """
+    
+    def __init__(self, directory: str = DISK_CACHE_DIR):
+        import diskcache
+        self._cache = diskcache.Cache(directory)
+    
+    def get(self, key: str) -> Optional[Any]:
+        return self._cache.get(key)
+    
+    def set(self, key: str, data: Any, ttl: int) -> None:
+        self._cache.set(key, data, expire=ttl)
+
+
+class TokenBucket:
+    """
+    令牌桶限流器（线程安全）
+    
+    以 rate 个/秒的速度补充令牌，最多累积 burst 个。
+    令牌不足时预占令牌并阻塞等待，并发调用按先后顺序排队。
+    """
+    
+    def __init__(self, rate: float, burst: int):
+        """
+        Args:
+            rate: 每秒补充的令牌数
+            burst: 令牌桶容量（允许的突发请求数）
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """获取一个令牌，必要时阻塞等待"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        
+        if wait_time > 0:
+            logger.debug(f"宏观数据请求达到速率限制，等待 {wait_time:.2f} 秒")
+            time.sleep(wait_time)
+
+
+def create_cache_backend() -> CacheBackend:
+    """
+    创建默认缓存后端：优先使用 diskcache，未安装或无法打开缓存目录时退回进程内缓存
+    """
+    try:
+        return DiskCacheBackend()
+    except ImportError:
+        logger.debug("diskcache 未安装，使用进程内缓存")
+    except Exception as e:
+        logger.warning(f"无法打开磁盘缓存，使用进程内缓存: {e}")
+    return MemoryCacheBackend()
+
 
 class MacroDataProvider:
     """
@@ -33,49 +290,198 @@ class MacroDataProvider:
     提供各种宏观经济数据的获取接口
     """
     
-    def __init__(self):
+    # 单例实例存储
+    _instance: Optional['MacroDataProvider'] = None
+    
+    def __init__(
+        self,
+        cache_backend: Optional[CacheBackend] = None,
+        fred_api_key: Optional[str] = None,
+        max_qps: float = 2.0,
+    ):
         """
         初始化宏观数据提供者
+        
+        Args:
+            cache_backend: 缓存后端，默认由 create_cache_backend() 创建
+            fred_api_key: FRED API Key，默认读取环境变量 FRED_API_KEY
+            max_qps: 对外部数据源的最大请求频率（次/秒），突发上限为 10 次
         """
-        self.fred_api_key = None  # 从配置读取
-        self.cache = {}
-        self.cache_expiry = {}
+        if not max_qps > 0:
+            raise ValueError(f"max_qps 必须为正数，当前为 {max_qps}")
+        if fred_api_key is None:
+            # 与 Config 读取同一环境变量，不依赖全局配置，模块可单独运行
+            fred_api_key = os.getenv('FRED_API_KEY')
+        self.fred_api_key = fred_api_key
+        self.per_call_timeout = 5.0  # 单项宏观数据获取超时（秒）
+        self._limiter = TokenBucket(rate=max_qps, burst=10)
+        self.cache = cache_backend if cache_backend is not None else create_cache_backend()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._key_locks_guard = threading.Lock()
+        
+        # 共享 HTTP 会话，用于直接请求的 FRED / Yahoo 图表接口，复用 TCP/TLS 连接
+        # （不传给 yfinance：它在进程内共享自带的 curl_cffi 会话，传入会替换该会话）；
+        # 对限流/服务端临时错误按指数退避自动重试，避免单次抖动导致因素缺失
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True,
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+        # 不重试的会话，用于可快速回退到其他数据源的请求
+        self._no_retry_session = requests.Session()
+        self._no_retry_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
         logger.info("初始化宏观数据提供者")
     
-    def _get_cached_data(self, key: str, max_age: int = 3600) -> Optional[Any]:
+    def _get_cached_data(self, key: str) -> Optional[Any]:
         """
         获取缓存数据
         
         Args:
             key: 缓存键
-            max_age: 最大缓存时间（秒）
             
         Returns:
             缓存的数据，如果不存在或已过期则返回 None
         """
-        if key not in self.cache:
-            return None
+        return self.cache.get(key)
+    
+    def _set_cached_data(self, key: str, data: Any, ttl: int) -> None:
+        """
+        设置缓存数据
         
-        if key not in self.cache_expiry:
-            return None
+        Args:
+            key: 缓存键
+            data: 要缓存的数据
+            ttl: 缓存有效期（秒）
+        """
+        self.cache.set(key, data, ttl)
+    
+    def _key_lock(self, key: str) -> threading.Lock:
+        """
+        获取缓存键对应的锁
         
-        if (datetime.now().timestamp() - self.cache_expiry[key]) > max_age:
-            del self.cache[key]
-            del self.cache_expiry[key]
+        并发获取同一份数据时，后到的调用在锁上等待先到的调用写入缓存后直接读取，避免重复请求
+        """
+        with self._key_locks_guard:
+            return self._key_locks.setdefault(key, threading.Lock())
+    
+    @classmethod
+    def get_instance(cls) -> 'MacroDataProvider':
+        """
+        获取宏观数据提供者单例
+        
+        多个分析器共享同一份缓存、HTTP 会话与限流令牌，避免重复获取宏观数据
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    @classmethod
+    def reset_instance(cls) -> None:
+        """重置单例（主要用于测试）"""
+        cls._instance = None
+    
+    def _ticker_info(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        获取 yfinance Ticker.info 并按代码缓存 1 小时
+        
+        同一代码的 info 在有效期内只请求一次，获取失败时抛出异常由调用方处理。
+        
+        Args:
+            symbol: Yahoo Finance 代码
+            
+        Returns:
+            Ticker.info 字典，yfinance 未安装时返回 None
+        """
+        cache_key = f"info_{symbol}"
+        cached = self._get_cached_data(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            import yfinance as yf
+        except ImportError:
+            logger.error("yfinance 未安装，请运行: pip install yfinance")
             return None
         
-        return self.cache[key]
+        self._limiter.acquire()
+        info = yf.Ticker(symbol).info
+        self._set_cached_data(cache_key, info, ttl=3600)
+        return info
     
-    def _set_cached_data(self, key: str, data: Any) -> None:
+    def _fetch_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        retry: bool = True,
+        timeout: float = 10,
+    ) -> Any:
         """
-        设置缓存数据
+        通过共享会话请求 JSON 接口并解析
+        
+        已安装 orjson 时用其解析响应体（比标准库 json 更快），否则使用 response.json()。
+        请求失败或响应无法解析时抛出异常，由调用方处理。
         
         Args:
-            key: 缓存键
-            data: 要缓存的数据
+            url: 接口地址
+            params: 查询参数
+            headers: 额外请求头
+            retry: 是否对限流/服务端临时错误自动重试
+            timeout: 请求超时（秒）
+            
+        Returns:
+            解析后的 JSON 数据
+        """
+        self._limiter.acquire()
+        session = self.session if retry else self._no_retry_session
+        response = session.get(url, params=params, headers=headers, timeout=timeout)
+        response.raise_for_status()
+        if orjson_available:
+            return orjson.loads(response.content)
+        return response.json()
+    
+    def _fred_observations(self, series_id: str, limit: int = 1) -> Optional[List[float]]:
+        """
+        获取 FRED 序列最近的观测值（按日期倒序）
+        
+        未配置 FRED API Key 或请求失败时返回 None，由调用方回退到 Yahoo Finance。
+        
+        Args:
+            series_id: FRED 序列代码，如 DFF、CPIAUCSL、DGS10
+            limit: 需要的观测值数量
+            
+        Returns:
+            最近 limit 个有效观测值，最新的在前
         """
-        self.cache[key] = data
-        self.cache_expiry[key] = datetime.now().timestamp()
+        if not self.fred_api_key:
+            return None
+        
+        try:
+            doc = self._fetch_json(FRED_API_URL, params={
+                "series_id": series_id,
+                "api_key": self.fred_api_key,
+                "file_type": "json",
+                "sort_order": "desc",
+                # 多取几条，跳过节假日的缺失值 "."
+                "limit": limit + 5,
+            })
+            observations = doc.get("observations", [])
+        except Exception as e:
+            # 异常信息中含有带 api_key 的完整 URL，只记录状态码或异常类型，避免泄露密钥
+            response = getattr(e, "response", None)
+            reason = f"HTTP {response.status_code}" if response is not None else type(e).__name__
+            logger.warning(f"获取 FRED 序列 {series_id} 失败（{reason}），回退到 Yahoo Finance")
+            return None
+        
+        values = [float(o["value"]) for o in observations if o.get("value") not in (None, ".")]
+        if len(values) < limit:
+            logger.warning(f"FRED 序列 {series_id} 有效数据不足: {len(values)}/{limit}")
+            return None
+        return values[:limit]
     
     def get_dxy_index(self, days: int = 30) -> Optional[pd.DataFrame]:
         """
@@ -91,8 +497,8 @@ class MacroDataProvider:
             包含 DXY 数据的 DataFrame
         """
         cache_key = f"dxy_{days}"
-        cached = self._get_cached_data(cache_key, max_age=3600)
-        if cached:
+        cached = self._get_cached_data(cache_key)
+        if cached is not None:
             return cached
         
         try:
@@ -106,6 +512,7 @@ class MacroDataProvider:
             
             # 使用 Yahoo Finance 获取 DXY 数据
             ticker = yf.Ticker("DX-Y.NYB")
+            self._limiter.acquire()
             df = ticker.history(period=f"{days}d")
             
             if df.empty:
@@ -126,7 +533,7 @@ class MacroDataProvider:
             # 计算收益率
             df['return'] = df['close'].pct_change() * 100
             
-            self._set_cached_data(cache_key, df)
+            self._set_cached_data(cache_key, df, ttl=3600)
             logger.info(f"成功获取 DXY 数据，共 {len(df)} 条记录")
             return df
             
@@ -134,6 +541,111 @@ class MacroDataProvider:
             logger.error(f"获取 DXY 数据失败: {e}")
             return None
     
+    def _yahoo_chart_closes(
+        self,
+        symbol: str,
+        range_: str = "5d",
+        interval: str = "1d",
+        n: int = 2,
+    ) -> Optional[np.ndarray]:
+        """
+        通过 Yahoo Finance 图表接口获取最近 n 个收盘价
+        
+        直接解析 JSON 中的收盘价序列，不经过 yfinance/pandas。
+        
+        Args:
+            symbol: Yahoo Finance 代码
+            range_: 时间范围，如 5d
+            interval: K 线周期，如 1d
+            n: 需要的收盘价个数
+            
+        Returns:
+            按时间升序排列的收盘价数组，请求、解析失败或不足 n 个时返回 None
+        """
+        try:
+            # 作为首选尝试，不重试且使用短超时，失败时尽快回退，避免耗尽 per_call_timeout
+            doc = self._fetch_json(
+                YAHOO_CHART_URL.format(symbol=symbol),
+                params={"range": range_, "interval": interval},
+                headers=_YAHOO_HEADERS,
+                retry=False,
+                timeout=_YAHOO_CHART_TIMEOUT,
+            )
+            closes = doc["chart"]["result"][0]["indicators"]["quote"][0]["close"]
+            # 停牌/未收盘的 K 线收盘价为 null
+            closes = np.array([c for c in closes if c is not None][-n:], dtype=float)
+        except Exception as e:
+            logger.warning(f"Yahoo 图表接口获取 {symbol} 失败，回退到 yfinance: {e}")
+            return None
+        
+        if len(closes) < n:
+            logger.warning(f"Yahoo 图表接口 {symbol} 收盘价不足 {n} 个，回退到 yfinance")
+            return None
+        return closes
+    
+    def _get_dxy_close_tail(self, n: int = 2, days: int = 5) -> Optional[np.ndarray]:
+        """
+        获取美元指数最近 n 个交易日的收盘价
+        
+        优先直接请求 Yahoo 图表接口，失败时回退到 yfinance 并只读取 Close 列，
+        均不构建清理后的完整 DataFrame（不重命名列、不转换时区、不计算整列收益率）。
+        
+        Args:
+            n: 需要的收盘价个数
+            days: 拉取的自然日窗口，需覆盖周末/节假日
+            
+        Returns:
+            按时间升序排列的收盘价数组，获取失败时返回 None
+        """
+        closes = self._yahoo_chart_closes("DX-Y.NYB", range_=f"{days}d", n=n)
+        if closes is not None:
+            return closes
+        
+        try:
+            import yfinance as yf
+        except ImportError:
+            logger.error("yfinance 未安装，请运行: pip install yfinance")
+            return None
+        
+        try:
+            self._limiter.acquire()
+            close = yf.Ticker("DX-Y.NYB").history(period=f"{days}d")['Close']
+            # 与图表接口一致，跳过收盘价缺失的 K 线
+            return close.dropna().tail(n).to_numpy()
+        except Exception as e:
+            logger.error(f"获取 DXY 收盘价失败: {e}")
+            return None
+    
+    def get_dxy_last_change(self, days: int = 5) -> Optional[Tuple[float, float]]:
+        """
+        获取美元指数最新收盘价及较前一交易日的涨跌幅
+        
+        评分只需要最后两个收盘价，完整历史请使用 get_dxy_index。
+        
+        Args:
+            days: 拉取的自然日窗口，需覆盖周末/节假日以保证至少两个交易日
+            
+        Returns:
+            (最新收盘价, 涨跌幅百分比)，数据不足时返回 None
+        """
+        cache_key = f"dxy_last_change_{days}"
+        cached = self._get_cached_data(cache_key)
+        if cached is not None:
+            return cached
+        
+        closes = self._get_dxy_close_tail(2, days)
+        if closes is None:
+            return None
+        if len(closes) < 2:
+            logger.warning("DXY 数据不足两个交易日，无法计算涨跌幅")
+            return None
+        
+        previous, current = closes
+        result = (current, (current - previous) / previous * 100)
+        
+        self._set_cached_data(cache_key, result, ttl=3600)
+        return result
+    
     def get_us_treasury_yield(self, maturity: str = "10Y") -> Optional[float]:
         """
         获取美国国债收益率
@@ -145,15 +657,17 @@ class MacroDataProvider:
             国债收益率（百分比）
         """
         cache_key = f"treasury_{maturity}"
-        cached = self._get_cached_data(cache_key, max_age=3600)
-        if cached:
+        cached = self._get_cached_data(cache_key)
+        if cached is not None:
             return cached
         
-        try:
-            import yfinance as yf
-        except ImportError:
-            logger.error("yfinance 未安装，请运行: pip install yfinance")
-            return None
+        # 优先使用 FRED 国债收益率序列
+        observations = self._fred_observations(_FRED_TREASURY_SERIES.get(maturity, "DGS10"))
+        if observations is not None:
+            yield_rate = round(observations[0], 2)
+            self._set_cached_data(cache_key, yield_rate, ttl=3600)
+            logger.info(f"成功获取 {maturity} 国债收益率 (FRED): {yield_rate}%")
+            return yield_rate
         
         try:
             logger.info(f"获取美国国债收益率: {maturity}")
@@ -167,10 +681,11 @@ class MacroDataProvider:
             }
             
             ticker_symbol = treasury_map.get(maturity, "IEF")
-            ticker = yf.Ticker(ticker_symbol)
             
             # 获取ETF信息
-            info = ticker.info
+            info = self._ticker_info(ticker_symbol)
+            if info is None:
+                return None
             
             # 计算收益率近似值
             # 方法1: 使用 yield 字段
@@ -191,7 +706,7 @@ class MacroDataProvider:
                     return None
             
             yield_rate = round(yield_rate, 2)
-            self._set_cached_data(cache_key, yield_rate)
+            self._set_cached_data(cache_key, yield_rate, ttl=3600)
             logger.info(f"成功获取 {maturity} 国债收益率: {yield_rate}%")
             return yield_rate
             
@@ -209,30 +724,33 @@ class MacroDataProvider:
             联邦基金利率（百分比）
         """
         cache_key = "fed_funds_rate"
-        cached = self._get_cached_data(cache_key, max_age=86400)  # 缓存24小时
-        if cached:
+        cached = self._get_cached_data(cache_key)
+        if cached is not None:
             return cached
         
-        try:
-            import yfinance as yf
-        except ImportError:
-            logger.error("yfinance 未安装，请运行: pip install yfinance")
-            return None
+        # 优先使用 FRED 联邦基金有效利率 (DFF)
+        observations = self._fred_observations("DFF")
+        if observations is not None:
+            fed_rate = round(observations[0], 2)
+            self._set_cached_data(cache_key, fed_rate, ttl=86400)  # 缓存24小时
+            logger.info(f"成功获取联邦基金利率 (FRED): {fed_rate}%")
+            return fed_rate
         
         try:
             logger.info("获取美联储联邦基金利率")
             
             # 使用 Yahoo Finance 获取联邦基金利率 ETF
             # 代码: FFIV (Federal Funds Rate ETF)
-            ticker = yf.Ticker("FFIV")
-            info = ticker.info
+            info = self._ticker_info("FFIV")
+            if info is None:
+                return None
             
             if 'regularMarketPrice' in info:
                 # FFIV 的价格近似等于联邦基金利率
                 fed_rate = info['regularMarketPrice']
                 fed_rate = round(fed_rate, 2)
                 
-                self._set_cached_data(cache_key, fed_rate)
+                self._set_cached_data(cache_key, fed_rate, ttl=86400)  # 缓存24小时
                 logger.info(f"成功获取联邦基金利率: {fed_rate}%")
                 return fed_rate
             else:
@@ -253,30 +771,50 @@ class MacroDataProvider:
             通胀率（百分比）
         """
         cache_key = "us_inflation"
-        cached = self._get_cached_data(cache_key, max_age=86400)  # 缓存24小时
-        if cached:
+        cached = self._get_cached_data(cache_key)
+        if cached is not None:
             return cached
         
-        try:
-            import yfinance as yf
-        except ImportError:
-            logger.error("yfinance 未安装，请运行: pip install yfinance")
-            return None
+        # 评分时通胀因素与实际利率并发获取通胀率，加锁保证只请求一次
+        with self._key_lock(cache_key):
+            cached = self._get_cached_data(cache_key)
+            if cached is not None:
+                return cached
+            return self._fetch_us_inflation_rate(cache_key)
+    
+    def _fetch_us_inflation_rate(self, cache_key: str) -> Optional[float]:
+        """
+        请求美国通胀率并写入缓存，优先 FRED CPI，失败时回退到 Yahoo Finance
+        
+        Args:
+            cache_key: 缓存键
+            
+        Returns:
+            通胀率（百分比）
+        """
+        # 优先使用 FRED CPI (CPIAUCSL) 计算同比通胀率
+        observations = self._fred_observations("CPIAUCSL", limit=13)
+        if observations is not None:
+            inflation_rate = round((observations[0] / observations[12] - 1) * 100, 2)
+            self._set_cached_data(cache_key, inflation_rate, ttl=86400)  # 缓存24小时
+            logger.info(f"成功获取美国通胀率 (FRED CPI 同比): {inflation_rate}%")
+            return inflation_rate
         
         try:
             logger.info("获取美国通胀率 (CPI)")
             
             # 使用 Yahoo Finance 获取通胀 ETF
             # 代码: TIP (通胀保值债券 ETF)
-            ticker = yf.Ticker("TIP")
-            info = ticker.info
+            info = self._ticker_info("TIP")
+            if info is None:
+                return None
             
             if 'yield' in info:
                 # TIP 的收益率可以近似反映通胀预期
                 inflation_rate = info['yield']
                 inflation_rate = round(inflation_rate, 2)
                 
-                self._set_cached_data(cache_key, inflation_rate)
+                self._set_cached_data(cache_key, inflation_rate, ttl=86400)  # 缓存24小时
                 logger.info(f"成功获取美国通胀率: {inflation_rate}%")
                 return inflation_rate
             else:
@@ -297,8 +835,8 @@ class MacroDataProvider:
             实际利率（百分比）
         """
         cache_key = "real_interest_rate"
-        cached = self._get_cached_data(cache_key, max_age=3600)
-        if cached:
+        cached = self._get_cached_data(cache_key)
+        if cached is not None:
             return cached
         
         # 获取名义利率（10年期国债收益率）
@@ -318,7 +856,7 @@ class MacroDataProvider:
         real_rate = nominal_rate - inflation_rate
         real_rate = round(real_rate, 2)
         
-        self._set_cached_data(cache_key, real_rate)
+        self._set_cached_data(cache_key, real_rate, ttl=3600)
         logger.info(f"计算实际利率: {real_rate}% (名义利率: {nominal_rate}%, 通胀率: {inflation_rate}%)")
         return real_rate
     
@@ -332,8 +870,8 @@ class MacroDataProvider:
             包含央行购金数据的字典
         """
         cache_key = "central_bank_gold"
-        cached = self._get_cached_data(cache_key, max_age=86400)  # 缓存24小时
-        if cached:
+        cached = self._get_cached_data(cache_key)
+        if cached is not None:
             return cached
         
         try:
@@ -356,10 +894,9 @@ class MacroDataProvider:
                 ],
                 "year_to_date": 912,  # 2024年至今累计
                 "yoy_change": 15.3,  # 同比增长百分比
-                "timestamp": datetime.now().isoformat()
             }
             
-            self._set_cached_data(cache_key, data)
+            self._set_cached_data(cache_key, data, ttl=86400)  # 缓存24小时
             logger.info(f"成功获取央行购金数据，最新季度: {data['latest_quarter']}, 总购买量: {data['total_purchases']}吨")
             return data
             
@@ -377,8 +914,8 @@ class MacroDataProvider:
             地缘政治风险指数 (0-100)
         """
         cache_key = "geopolitical_risk"
-        cached = self._get_cached_data(cache_key, max_age=3600)
-        if cached:
+        cached = self._get_cached_data(cache_key)
+        if cached is not None:
             return cached
         
         try:
@@ -392,7 +929,7 @@ class MacroDataProvider:
             # 模拟数据 (基于当前全球形势)
             risk_index = 65  # 中等偏高风险
             
-            self._set_cached_data(cache_key, risk_index)
+            self._set_cached_data(cache_key, risk_index, ttl=3600)
             logger.info(f"成功获取地缘政治风险指数: {risk_index}/100")
             return risk_index
             
@@ -408,13 +945,60 @@ class GoldMacroAnalyzer:
     分析各种宏观因素对黄金价格的影响
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        data_provider: Optional[MacroDataProvider] = None,
+        weights: Optional[Dict[str, float]] = None,
+    ):
         """
         初始化黄金宏观因素分析器
+        
+        Args:
+            data_provider: 宏观数据提供者，默认使用进程内共享的单例
+            weights: 各因素权重（因素名 -> 权重），未指定的因素权重为 1，默认等权
         """
-        self.data_provider = MacroDataProvider()
+        if weights is not None:
+            for name, weight in weights.items():
+                if not np.isfinite(weight) or weight < 0:
+                    raise ValueError(f"宏观因素 {name} 的权重必须为非负有限数，当前为 {weight}")
+        self.data_provider = data_provider or MacroDataProvider.get_instance()
+        self.weights = weights
         logger.info("初始化黄金宏观因素分析器")
     
+    def _fetch_factor_data(self) -> Dict[str, Any]:
+        """
+        并发读取各宏观因素的数据
+        
+        各数据源均为 I/O 密集型调用，并发执行后总耗时取决于最慢的一项，
+        且不超过 data_provider.per_call_timeout。单项失败或超时时记为 None，
+        不影响其他因素参与评分。
+        
+        Returns:
+            因素名 -> (分档依据, 输出字段) 或 None
+        """
+        provider = self.data_provider
+        executor = ThreadPoolExecutor(max_workers=len(_RULES))
+        try:
+            futures = {rule.name: executor.submit(rule.reader, provider) for rule in _RULES}
+            # 各任务同时开始，统一等待即相当于逐项超时
+            wait(futures.values(), timeout=provider.per_call_timeout)
+        finally:
+            # 不等待超时的任务结束，避免慢数据源拖住整体评分
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        data = {}
+        for name, future in futures.items():
+            if not future.done():
+                logger.warning(f"获取宏观因素 {name} 数据超时（{provider.per_call_timeout}秒），跳过该因素")
+                data[name] = None
+                continue
+            try:
+                data[name] = future.result()
+            except Exception as e:
+                logger.error(f"获取宏观因素 {name} 数据失败: {e}")
+                data[name] = None
+        return data
+    
     def get_macro_score(self) -> Dict[str, Any]:
         """
         获取综合宏观因素评分
@@ -431,134 +1015,39 @@ class GoldMacroAnalyzer:
                 "summary": "美元强势压制黄金，但通胀支撑价格"
             }
         """
+        data = self._fetch_factor_data()
         factors = {}
         
-        # 1. 美元指数影响
-        dxy_data = self.data_provider.get_dxy_index(days=5)
-        if dxy_data is not None and len(dxy_data) >= 2:
-            dxy_current = dxy_data['close'].iloc[-1]
-            dxy_change = (dxy_current - dxy_data['close'].iloc[-2]) / dxy_data['close'].iloc[-2] * 100
-            
-            # 美元上涨 → 利空黄金
-            if dxy_change > 0.5:
-                dxy_score = 30  # 利空
-                dxy_impact = "bearish"
-            elif dxy_change < -0.5:
-                dxy_score = 70  # 利好
-                dxy_impact = "bullish"
-            else:
-                dxy_score = 50  # 中性
-                dxy_impact = "neutral"
-                
-            factors["dxy"] = {
-                "value": round(dxy_current, 2),
-                "change": round(dxy_change, 2),
-                "impact": dxy_impact,
-                "score": dxy_score
-            }
-        
-        # 2. 实际利率影响
-        real_rate = self.data_provider.get_real_interest_rate()
-        if real_rate is not None:
-            # 实际利率上升 → 利空黄金
-            if real_rate > 2.0:
-                rate_score = 20
-                rate_impact = "strongly_bearish"
-            elif real_rate > 1.0:
-                rate_score = 35
-                rate_impact = "bearish"
-            elif real_rate > 0:
-                rate_score = 50
-                rate_impact = "neutral"
-            else:
-                rate_score = 75
-                rate_impact = "bullish"
-                
-            factors["real_rate"] = {
-                "value": real_rate,
-                "impact": rate_impact,
-                "score": rate_score
-            }
-        
-        # 3. 通胀影响
-        inflation_rate = self.data_provider.get_us_inflation_rate()
-        if inflation_rate is not None:
-            # 通胀上升 → 利好黄金
-            if inflation_rate > 4.0:
-                inflation_score = 80
-                inflation_impact = "strongly_bullish"
-            elif inflation_rate > 3.0:
-                inflation_score = 70
-                inflation_impact = "bullish"
-            elif inflation_rate > 2.0:
-                inflation_score = 50
-                inflation_impact = "neutral"
-            else:
-                inflation_score = 30
-                inflation_impact = "bearish"
-                
-            factors["inflation"] = {
-                "value": inflation_rate,
-                "impact": inflation_impact,
-                "score": inflation_score
-            }
-        
-        # 4. 央行购金影响
-        central_bank_data = self.data_provider.get_central_bank_gold_purchases()
-        if central_bank_data:
-            total_purchases = central_bank_data.get("total_purchases", 0)
-            
-            if total_purchases > 300:
-                cb_score = 85
-                cb_impact = "strongly_bullish"
-            elif total_purchases > 150:
-                cb_score = 75
-                cb_impact = "bullish"
-            elif total_purchases > 50:
-                cb_score = 60
-                cb_impact = "slightly_bullish"
-            else:
-                cb_score = 50
-                cb_impact = "neutral"
-                
-            factors["central_bank"] = {
-                "value": total_purchases,
-                "impact": cb_impact,
-                "score": cb_score
-            }
-        
-        # 5. 地缘政治风险影响
-        geopolitical_risk = self.data_provider.get_geopolitical_risk_index()
-        if geopolitical_risk is not None:
-            # 地缘政治风险上升 → 利好黄金
-            if geopolitical_risk > 70:
-                geo_score = 80
-                geo_impact = "strongly_bullish"
-            elif geopolitical_risk > 50:
-                geo_score = 65
-                geo_impact = "bullish"
-            elif geopolitical_risk > 30:
-                geo_score = 50
-                geo_impact = "neutral"
-            else:
-                geo_score = 30
-                geo_impact = "bearish"
-                
-            factors["geopolitical"] = {
-                "value": geopolitical_risk,
-                "impact": geo_impact,
-                "score": geo_score
-            }
+        # 1. 按规则表逐项评分（缺失的因素不参与）
+        for rule in _RULES:
+            reading = data[rule.name]
+            if reading is None:
+                continue
+            # NaN 会被 searchsorted 分到最高一档，视同数据缺失
+            if not np.isfinite(reading[0]):
+                logger.warning(f"宏观因素 {rule.name} 数据无效（{reading[0]}），跳过该因素")
+                continue
+            factors[rule.name] = rule.apply(*reading)
         
-        # 6. 计算综合得分
+        # 2. 计算综合得分（可按因素加权）
         if factors:
-            total_score = sum(f["score"] for f in factors.values()) / len(factors)
+            scores = np.fromiter((f["score"] for f in factors.values()), dtype=np.int16, count=len(factors))
+            weights = None
+            if self.weights:
+                weights = np.fromiter(
+                    (self.weights.get(name, 1.0) for name in factors), dtype=float, count=len(factors)
+                )
+            if weights is not None and weights.sum() > 0:
+                total_score = float(np.average(scores, weights=weights))
+            else:
+                # 未加权，或已获取因素的权重之和为 0 时取等权平均
+                total_score = float(scores.mean())
         else:
             total_score = 50
             
         total_score = round(total_score)
         
-        # 7. 生成总结
+        # 3. 生成总结
         summary = self._generate_summary(factors)
         
         return {
@@ -581,29 +1070,16 @@ class GoldMacroAnalyzer:
         if not factors:
             return "暂无宏观数据，保持中性看法"
         
-        bullish_factors = []
-        bearish_factors = []
-        neutral_factors = []
-        
-        for factor_name, factor_data in factors.items():
+        bullish_count = 0
+        bearish_count = 0
+        for factor_data in factors.values():
             impact = factor_data.get("impact", "neutral")
-            if impact in ["bullish", "strongly_bullish", "slightly_bullish"]:
-                bullish_factors.append(factor_name)
-            elif impact in ["bearish", "strongly_bearish"]:
-                bearish_factors.append(factor_name)
-            else:
-                neutral_factors.append(factor_name)
-        
-        if bullish_factors and not bearish_factors:
-            return f"宏观环境整体利好黄金（{len(bullish_factors)}项利好因素）"
-        elif bearish_factors and not bullish_factors:
-            return f"宏观环境整体利空黄金（{len(bearish_factors)}项利空因素）"
-        elif len(bullish_factors) > len(bearish_factors):
-            return f"宏观环境偏利好黄金（{len(bullish_factors)}项利好 vs {len(bearish_factors)}项利空）"
-        elif len(bearish_factors) > len(bullish_factors):
-            return f"宏观环境偏利空黄金（{len(bullish_factors)}项利好 vs {len(bearish_factors)}项利空）"
-        else:
-            return "宏观环境中性，关注技术面信号"
+            if impact in _BULLISH_IMPACTS:
+                bullish_count += 1
+            elif impact in _BEARISH_IMPACTS:
+                bearish_count += 1
+        
+        return _summary_for(bullish_count, bearish_count)
 
 
 if __name__ == "__main__":
@@ -959,7 +959,7 @@ class NotificationService:
             lines.append("")
             
             # 评分详情（如果有详细评分数据）
-            if tech_analysis and hasattr(tech_analysis, 'technical_score'):
+            if tech_analysis and getattr(tech_analysis, 'technical_score', None) is not None:
                 tech_score = getattr(tech_analysis, 'technical_score', 50)
                 news_score = getattr(tech_analysis, 'macro_news_score', 50)
                 data_score = getattr(tech_analysis, 'macro_data_score', 50)
@@ -77,9 +77,9 @@ class RSIStatus(Enum):
     OVERSOLD = "超卖"         # RSI < 30
 
 
-@dataclass
+@dataclass(slots=True)
 class TrendAnalysisResult:
-    """趋势分析结果"""
+    """趋势分析结果（使用 __slots__，不能动态添加未声明的字段）"""
     code: str
     
     # 趋势判断
@@ -129,6 +129,17 @@ class TrendAnalysisResult:
     signal_score: int = 0            # 综合评分 0-100
     signal_reasons: List[str] = field(default_factory=list)
     risk_factors: List[str] = field(default_factory=list)
+
+    # 宏观因素（黄金分析 analyze_with_macro 填充，未分析时为 None）
+    technical_score: Optional[int] = None      # 宏观调整前的技术评分
+    macro_news_score: Optional[int] = None     # 新闻宏观评分
+    macro_data_score: Optional[int] = None     # 结构化数据宏观评分
+    total_macro_score: Optional[int] = None    # 综合宏观评分
+    macro_score: Optional[int] = None          # 结构化宏观数据评分
+    macro_summary: Optional[str] = None        # 宏观分析总结
+    macro_factors: Optional[Dict[str, Any]] = None   # 各宏观因素详情
+    macro_news: Optional[Dict[str, Any]] = None      # 宏观新闻搜索结果
+    macro_timestamp: Optional[str] = None      # 宏观数据时间
     
     def to_dict(self) -> Dict[str, Any]:
         return {
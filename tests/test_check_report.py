@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+===================================
+A股自选股智能分析系统 - 报告检查脚本单元测试
+===================================
+
+职责：
+1. 验证关键字检查与内容片段提取
+2. 验证大文件的 mmap 读取路径
+"""
+
+import io
+import mmap
+import os
+import tempfile
+import unittest
+
+import check_report
+
+
+def _snippets(text: str) -> list:
+    """提取片段并解码为 (行号, 文本) 列表"""
+    return [
+        (line_no, line.decode('utf-8'))
+        for line_no, line in check_report._iter_snippet_lines(text.encode('utf-8'))
+    ]
+
+
+class SnippetLinesTestCase(unittest.TestCase):
+    """内容片段提取测试"""
+
+    def test_crlf_lines_are_stripped(self) -> None:
+        """CRLF 换行的报告不保留行尾 \\r"""
+        self.assertEqual(
+            _snippets("标题\r\n黄金走势\r\n其他\r\nGC=F 期货\r\n"),
+            [(2, "黄金走势"), (4, "GC=F 期货")],
+        )
+
+    def test_last_line_without_newline(self) -> None:
+        """末行没有换行符时完整输出"""
+        self.assertEqual(_snippets("标题\n结论：🥇 看多"), [(2, "结论：🥇 看多")])
+
+    def test_multiple_hits_yield_line_once(self) -> None:
+        """同一行多次命中只输出一次"""
+        self.assertEqual(
+            _snippets("黄金 Au9999 黄金 GC=F\n无关\n🥇\n"),
+            [(1, "黄金 Au9999 黄金 GC=F"), (3, "🥇")],
+        )
+
+
+class FindKeywordsTestCase(unittest.TestCase):
+    """关键字检查测试"""
+
+    def test_section_title_implies_gold(self) -> None:
+        """'黄金投资分析' 同时计为命中 '黄金'"""
+        self.assertEqual(
+            check_report._find_keywords("## 黄金投资分析".encode('utf-8')),
+            {'黄金', '黄金投资分析'},
+        )
+
+    def test_missing_keywords_are_not_reported(self) -> None:
+        """未出现的关键字不计入"""
+        self.assertEqual(check_report._find_keywords("Au9999 收盘".encode('utf-8')), {'Au9999'})
+
+
+class LargeReportTestCase(unittest.TestCase):
+    """大文件 mmap 读取测试"""
+
+    def setUp(self) -> None:
+        """生成超过 mmap 阈值的报告文件"""
+        padding = "无关内容\n" * (check_report.MMAP_THRESHOLD // 10 + 1)
+        fd, self.path = tempfile.mkstemp(suffix='.md')
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(padding + "## 黄金投资分析\r\n🥇 结论")
+        self.gold_line = padding.count("\n") + 1
+
+    def tearDown(self) -> None:
+        """删除临时文件"""
+        os.remove(self.path)
+
+    def test_large_report_uses_mmap(self) -> None:
+        """超过阈值的文件以 mmap 读取，检查结果与小文件一致"""
+        with check_report._open_report(self.path) as content:
+            self.assertIsInstance(content, mmap.mmap)
+
+        out = io.StringIO()
+        self.assertTrue(check_report.check_report_file(self.path, out=out))
+
+        output = out.getvalue()
+        self.assertIn("✅ 包含黄金章节: True", output)
+        self.assertIn(f"行 {self.gold_line}: ## 黄金投资分析\n", output)
+        self.assertIn(f"行 {self.gold_line + 1}: 🥇 结论", output)
+
+
+if __name__ == "__main__":
+    unittest.main()
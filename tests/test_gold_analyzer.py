@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+===================================
+A股自选股智能分析系统 - 黄金趋势分析单元测试
+===================================
+
+职责：
+1. 验证宏观新闻关键词统计逻辑
+"""
+
+import unittest
+
+from src.gold_analyzer import GoldTrendAnalyzer
+from src.search_service import SearchResponse, SearchResult
+
+
+class GoldMacroFactorsTestCase(unittest.TestCase):
+    """宏观新闻因素分析测试"""
+
+    def setUp(self) -> None:
+        """初始化分析器"""
+        self.analyzer = GoldTrendAnalyzer()
+
+    def _build_response(self, *items: tuple, success: bool = True) -> SearchResponse:
+        """构造搜索响应，items 为 (标题, 摘要) 列表"""
+        return SearchResponse(
+            query="黄金",
+            results=[
+                SearchResult(title=title, snippet=snippet, url="", source="test")
+                for title, snippet in items
+            ],
+            provider="test",
+            success=success,
+        )
+
+    def test_overlapping_keywords_counted_once_per_news(self) -> None:
+        """重叠关键词分别计数，同一条新闻内重复出现只计一次"""
+        macro_news = {
+            "通胀": self._build_response(("通胀缓解 降息", "加息 加息")),
+        }
+
+        analysis = self.analyzer._analyze_macro_factors(macro_news)
+
+        factor = analysis["factors"]["通胀"]
+        self.assertEqual(factor["bullish_count"], 2)  # 加息、通胀
+        self.assertEqual(factor["bearish_count"], 2)  # 降息、通胀缓解
+        self.assertEqual(factor["score"], 50)
+
+    def test_failed_or_empty_responses_are_skipped(self) -> None:
+        """失败或空的搜索结果不参与评分"""
+        macro_news = {
+            "失败": self._build_response(("避险", ""), success=False),
+            "空": self._build_response(),
+            "利好": self._build_response(("地缘政治", "避险 央行购金")),
+        }
+
+        analysis = self.analyzer._analyze_macro_factors(macro_news)
+
+        self.assertEqual(list(analysis["factors"]), ["利好"])
+        self.assertEqual(analysis["factors"]["利好"]["score"], 80)
+        self.assertEqual(analysis["total_score"], 53)
+
+
+if __name__ == "__main__":
+    unittest.main()
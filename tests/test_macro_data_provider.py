@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+"""
+===================================
+A股自选股智能分析系统 - 宏观数据模块单元测试
+===================================
+
+职责：
+1. 验证宏观数据缓存的过期逻辑
+2. 验证宏观因素分档规则与原判断逻辑一致
+3. 验证宏观评分在数据源失败/超时时的降级
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from src.macro_data_provider import _RULES, GoldMacroAnalyzer, MacroDataProvider, MemoryCacheBackend
+
+EPS = 1e-9
+
+# 各规则在阈值及其两侧的期望分档：(分档依据, 影响, 得分)，与原 if/elif 判断一致
+RULE_CASES = {
+    "dxy": (
+        (-0.5 - EPS, "bullish", 70),
+        (-0.5, "neutral", 50),
+        (-0.5 + EPS, "neutral", 50),
+        (0.5 - EPS, "neutral", 50),
+        (0.5, "neutral", 50),
+        (0.5 + EPS, "bearish", 30),
+    ),
+    "real_rate": (
+        (0.0 - EPS, "bullish", 75),
+        (0.0, "bullish", 75),
+        (0.0 + EPS, "neutral", 50),
+        (1.0, "neutral", 50),
+        (1.0 + EPS, "bearish", 35),
+        (2.0, "bearish", 35),
+        (2.0 + EPS, "strongly_bearish", 20),
+    ),
+    "inflation": (
+        (2.0 - EPS, "bearish", 30),
+        (2.0, "bearish", 30),
+        (2.0 + EPS, "neutral", 50),
+        (3.0, "neutral", 50),
+        (3.0 + EPS, "bullish", 70),
+        (4.0, "bullish", 70),
+        (4.0 + EPS, "strongly_bullish", 80),
+    ),
+    "central_bank": (
+        (50 - EPS, "neutral", 50),
+        (50, "neutral", 50),
+        (50 + EPS, "slightly_bullish", 60),
+        (150, "slightly_bullish", 60),
+        (150 + EPS, "bullish", 75),
+        (300, "bullish", 75),
+        (300 + EPS, "strongly_bullish", 85),
+    ),
+    "geopolitical": (
+        (30 - EPS, "bearish", 30),
+        (30, "bearish", 30),
+        (30 + EPS, "neutral", 50),
+        (50, "neutral", 50),
+        (50 + EPS, "bullish", 65),
+        (70, "bullish", 65),
+        (70 + EPS, "strongly_bullish", 80),
+    ),
+}
+
+
+class MacroDataCacheTestCase(unittest.TestCase):
+    """宏观数据缓存测试"""
+
+    def setUp(self) -> None:
+        """使用进程内缓存初始化数据提供者"""
+        self.provider = MacroDataProvider(cache_backend=MemoryCacheBackend())
+
+    def test_ttl_is_bound_to_entry(self) -> None:
+        """过期时间由写入时的 TTL 决定"""
+        with patch("src.macro_data_provider.time.monotonic", return_value=1000.0):
+            self.provider._set_cached_data("fed_funds_rate", 5.25, ttl=86400)
+
+        with patch("src.macro_data_provider.time.monotonic", return_value=1000.0 + 3601):
+            self.assertEqual(self.provider._get_cached_data("fed_funds_rate"), 5.25)
+
+        with patch("src.macro_data_provider.time.monotonic", return_value=1000.0 + 86400):
+            self.assertIsNone(self.provider._get_cached_data("fed_funds_rate"))
+
+    def test_falsy_values_are_served_from_cache(self) -> None:
+        """0 等假值同样命中缓存，不会触发重新获取"""
+        self.provider._set_cached_data("us_inflation", 0, ttl=3600)
+
+        with patch.object(self.provider, "_ticker_info") as ticker_info:
+            self.assertEqual(self.provider.get_us_inflation_rate(), 0)
+            ticker_info.assert_not_called()
+
+    def test_fred_failure_does_not_log_api_key(self) -> None:
+        """FRED 请求失败时日志不包含 API Key"""
+        provider = MacroDataProvider(cache_backend=MemoryCacheBackend(), fred_api_key="SECRETKEY123")
+        response = MagicMock(status_code=400)
+        response.raise_for_status.side_effect = requests.HTTPError(
+            "400 Client Error for url: https://api.stlouisfed.org/fred/series/observations"
+            "?series_id=DFF&api_key=SECRETKEY123",
+            response=response,
+        )
+
+        with patch.object(provider.session, "get", return_value=response), \
+                self.assertLogs("src.macro_data_provider", level="WARNING") as logs:
+            self.assertIsNone(provider._fred_observations("DFF"))
+
+        self.assertIn("HTTP 400", logs.output[0])
+        self.assertNotIn("SECRETKEY123", "".join(logs.output))
+
+    def test_inflation_is_fetched_once_per_score(self) -> None:
+        """通胀因素与实际利率并发评分时只请求一次 CPI 序列"""
+        provider = MacroDataProvider(cache_backend=MemoryCacheBackend(), fred_api_key="KEY")
+        provider.get_dxy_last_change = lambda: (100.0, 1.0)
+        requested = []
+
+        def fetch_json(url, params=None, **kwargs):
+            requested.append(params["series_id"])
+            if params["series_id"] == "CPIAUCSL":
+                # CPI 请求较慢，实际利率在其返回前就需要通胀率
+                time.sleep(0.1)
+            return {"observations": [{"value": "4.0"}] * (params["limit"])}
+
+        with patch.object(provider, "_fetch_json", side_effect=fetch_json):
+            result = GoldMacroAnalyzer(data_provider=provider).get_macro_score()
+
+        self.assertEqual(requested.count("CPIAUCSL"), 1)
+        self.assertIn("real_rate", result["factors"])
+        self.assertIn("inflation", result["factors"])
+
+    def test_invalid_max_qps_is_rejected(self) -> None:
+        """请求频率必须为正数"""
+        for max_qps in (0, -1, float("nan")):
+            with self.assertRaises(ValueError):
+                MacroDataProvider(cache_backend=MemoryCacheBackend(), max_qps=max_qps)
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        """超过容量时淘汰最久未使用的条目"""
+        cache = MemoryCacheBackend(maxsize=2)
+        cache.set("dxy_5", 1, ttl=3600)
+        cache.set("dxy_30", 2, ttl=3600)
+        cache.get("dxy_5")
+        cache.set("dxy_60", 3, ttl=3600)
+
+        self.assertIsNone(cache.get("dxy_30"))
+        self.assertEqual(cache.get("dxy_5"), 1)
+        self.assertEqual(cache.get("dxy_60"), 3)
+
+
+class FactorRuleTestCase(unittest.TestCase):
+    """宏观因素分档规则测试"""
+
+    def test_rules_bucket_boundaries(self) -> None:
+        """阈值及其两侧的数值落在正确的分档"""
+        self.assertEqual({rule.name for rule in _RULES}, set(RULE_CASES))
+        for rule in _RULES:
+            for measure, impact, score in RULE_CASES[rule.name]:
+                with self.subTest(rule=rule.name, measure=measure):
+                    result = rule.apply(measure, {})
+                    self.assertEqual((result["impact"], result["score"]), (impact, score))
+
+
+class GoldMacroScoreTestCase(unittest.TestCase):
+    """宏观综合评分测试"""
+
+    def setUp(self) -> None:
+        """构造各数据源均返回固定值的分析器"""
+        self.release = threading.Event()
+        provider = MacroDataProvider(cache_backend=MemoryCacheBackend())
+        provider.per_call_timeout = 0.2
+        provider.get_dxy_last_change = lambda: (100.0, 1.0)
+        provider.get_real_interest_rate = lambda: 2.5
+        provider.get_us_inflation_rate = lambda: 4.5
+        provider.get_central_bank_gold_purchases = lambda: {"total_purchases": 228}
+        provider.get_geopolitical_risk_index = lambda: 65
+        self.provider = provider
+        self.analyzer = GoldMacroAnalyzer(data_provider=provider)
+
+    def tearDown(self) -> None:
+        """释放仍在等待的慢数据源线程"""
+        self.release.set()
+
+    def test_slow_and_failed_factors_are_skipped(self) -> None:
+        """超时与抛出异常的因素被跳过，其余因素照常评分"""
+        def hang():
+            self.release.wait(5)
+            return 80
+
+        def fail():
+            raise RuntimeError("upstream error")
+
+        self.provider.get_geopolitical_risk_index = hang
+        self.provider.get_us_inflation_rate = fail
+
+        result = self.analyzer.get_macro_score()
+
+        self.assertEqual(set(result["factors"]), {"dxy", "real_rate", "central_bank"})
+        self.assertEqual(result["total_score"], 42)  # (30 + 20 + 75) / 3
+
+    def test_non_finite_factors_are_skipped(self) -> None:
+        """NaN/inf 数据视同缺失，不参与评分"""
+        self.provider.get_dxy_last_change = lambda: (100.0, float("nan"))
+        self.provider.get_real_interest_rate = lambda: float("nan")
+        self.provider.get_us_inflation_rate = lambda: float("inf")
+
+        result = self.analyzer.get_macro_score()
+
+        self.assertEqual(set(result["factors"]), {"central_bank", "geopolitical"})
+        self.assertEqual(result["total_score"], 70)  # (75 + 65) / 2
+
+    def test_weighted_total_score(self) -> None:
+        """指定权重的因素按权重计入综合得分，其余因素权重为 1"""
+        self.analyzer.weights = {"dxy": 3}
+
+        result = self.analyzer.get_macro_score()
+
+        self.assertEqual(result["total_score"], 47)  # (30*3 + 20 + 80 + 75 + 65) / 7
+
+    def test_zero_weight_sum_falls_back_to_mean(self) -> None:
+        """已获取因素的权重之和为 0 时取等权平均"""
+        self.analyzer.weights = {"dxy": 0}
+        self.provider.get_real_interest_rate = lambda: None
+        self.provider.get_us_inflation_rate = lambda: None
+        self.provider.get_central_bank_gold_purchases = lambda: None
+        self.provider.get_geopolitical_risk_index = lambda: None
+
+        result = self.analyzer.get_macro_score()
+
+        self.assertEqual(result["total_score"], 30)
+
+    def test_invalid_weights_are_rejected(self) -> None:
+        """负数或非有限权重在初始化时报错"""
+        for weight in (-1, float("nan"), float("inf")):
+            with self.assertRaises(ValueError):
+                GoldMacroAnalyzer(data_provider=self.provider, weights={"dxy": weight})
+
+
+if __name__ == "__main__":
+    unittest.main()